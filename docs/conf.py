@@ -10,9 +10,10 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
-# import os
-# import sys
-# sys.path.insert(0, os.path.abspath('.'))
+# The API documentation is generated by sphinx-autoapi, which parses the sources statically,
+# so the package does not need to be importable here.
+import os
+import re
 
 
 # -- Project information -----------------------------------------------------
@@ -21,8 +22,11 @@ project = 'tmtccmd'
 copyright = '2021, Robin Mueller'
 author = 'Robin Mueller'
 
-# The full version, including alpha/beta/rc tags
-release = '1.5'
+# The full version, including alpha/beta/rc tags. It is read from the package sources instead of
+# importing tmtccmd, which would pull in all of its dependencies.
+with open(os.path.join(os.path.dirname(__file__), '..', 'src', 'tmtccmd', '__init__.py')) as init_file:
+    release = re.search(r'^__version__ = "([^"]+)"', init_file.read(), re.MULTILINE).group(1)
+version = release
 
 
 # -- General configuration ---------------------------------------------------
@@ -30,7 +34,12 @@ release = '1.5'
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
-extensions = ['sphinx.ext.intersphinx']
+extensions = ['autoapi.extension', 'sphinx.ext.intersphinx']
+
+# sphinx-autoapi settings. The generated package index autoapi/tmtccmd/index is included by api.rst.
+autoapi_type = 'python'
+autoapi_dirs = ['../src/tmtccmd']
+autoapi_add_toctree_entry = False
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
@@ -43,10 +52,6 @@ source_suffix = '.rst'
 # This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
-# List of directories, relative to source directory, that shouldn't be searched
-# for source files.
-exclude_trees = ['_build']
-
 # -- Options for HTML output -------------------------------------------------
 
 # The theme to use for HTML and HTML Help pages.  See the documentation for
@@ -0,0 +1,82 @@
+import socket
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from tmtccmd.com_if.com_interface_base import CommunicationInterface
+from tmtccmd.com_if.tcpip_udp_com_if import TcpIpUdpComIF
+from tmtccmd.core.definitions import CoreModeList
+from tmtccmd.ecss.tc import PusTelecommand
+from tmtccmd.pus_tm.service_17_test import Service17TM, Service17TmPacked
+from tmtccmd.utility.tmtc_printer import TmTcPrinter
+
+
+class QueueComIF(CommunicationInterface):
+    """
+    Minimal communication interface which stores received packets in the base class TM queue
+    """
+    def initialize(self, args: Any = None) -> Any:
+        pass
+
+    def open(self, args: Any = None) -> None:
+        pass
+
+    def close(self, args: Any = None) -> None:
+        pass
+
+    def send_data(self, data: bytearray) -> None:
+        pass
+
+    def send_telecommand(self, tc_packet: bytearray, tc_packet_obj: PusTelecommand) -> None:
+        pass
+
+    def data_available(self, parameters: Any = 0) -> int:
+        return 0
+
+    def handle_reception(self, raw_packet: bytearray):
+        self._push_tm(Service17TM(raw_packet))
+
+
+class TestComInterface(TestCase):
+    def test_tm_queue(self):
+        com_if = QueueComIF(tmtc_printer=TmTcPrinter(), tm_queue_max_len=2)
+        self.assertTrue(com_if.receive_telemetry() == [])
+        packets = []
+        for ssc in range(3):
+            raw_packet = Service17TmPacked(subservice=2, ssc=ssc).pack()
+            packets.append(Service17TM(raw_packet))
+            com_if.handle_reception(raw_packet)
+        # The oldest packet is discarded because the queue is full
+        received_sscs = [packet.get_ssc() for packet in com_if.receive_telemetry()]
+        self.assertTrue(received_sscs == [packet.get_ssc() for packet in packets[1:]])
+        self.assertTrue(com_if.receive_telemetry() == [])
+
+
+class TestUdpComInterface(TestCase):
+    def setUp(self):
+        self.udp_com_if = TcpIpUdpComIF(
+            tm_timeout=1, tc_timeout_factor=1, send_address=("127.0.0.1", 0), max_recv_size=1500,
+            recv_addr=("127.0.0.1", 0), init_mode=CoreModeList.IDLE, max_packets_per_poll=5
+        )
+        self.udp_com_if.open()
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def tearDown(self):
+        self.sender.close()
+        self.udp_com_if.close()
+
+    @patch("tmtccmd.com_if.tcpip_udp_com_if.PusTelemetryFactory.create", new=Service17TM)
+    def test_receive_telemetry(self):
+        recv_addr = self.udp_com_if.udp_socket.getsockname()
+        for ssc in range(12):
+            self.sender.sendto(Service17TmPacked(subservice=2, ssc=ssc).pack(), recv_addr)
+        # Each call reads at most max_packets_per_poll datagrams and stops early once the
+        # socket has no more datagrams
+        batches = [self.udp_com_if.receive_telemetry(poll_timeout=0.5) for _ in range(4)]
+        self.assertTrue([len(batch) for batch in batches] == [5, 5, 2, 0])
+        received_sscs = [packet.get_ssc() for batch in batches for packet in batch]
+        self.assertTrue(received_sscs == list(range(12)))
+        self.udp_com_if.close()
+        self.assertTrue(self.udp_com_if.selector is None)
+        self.assertFalse(self.udp_com_if.data_available())
+        self.assertTrue(self.udp_com_if.receive_telemetry() == [])
@@ -1,21 +1,31 @@
 #!/usr/bin/env python3
+import struct
 import unittest
 
 from unittest import TestCase
 from crcmod import crcmod
 
-from tmtccmd.ecss.tc import PusTelecommand
+from tmtccmd.ecss.tc import PusTelecommand, PusTcDataFieldHeaderSerialize
 from tmtccmd.ecss.tc import generate_crc, generate_packet_crc
-from tmtccmd.ccsds.spacepacket import get_sp_packet_sequence_control
+from tmtccmd.ccsds.spacepacket import get_sp_packet_sequence_control, get_sp_space_packet_header
 from tmtccmd.ecss.conf import set_default_apid, get_default_apid, PusVersion, get_pus_tm_version
 from tmtccmd.pus_tm.service_17_test import Service17TM, Service17TmPacked
 from tmtccmd.ecss.tm import PusTelemetry
+from tmtccmd.ecss.tm_creator import PusTelemetryCreator
+from tmtccmd.pus_tm.service_1_verification import Service1TM
+from tmtccmd.pus_tc.service_20_parameter import pack_float_vector_parameter_command
+from tmtccmd.pus_tm.service_20_parameters import Service20TM, logger as service_20_logger
 
 
 class TestTelemetry(TestCase):
     def test_space_packet_functions(self):
         psc = get_sp_packet_sequence_control(sequence_flags=0b111, source_sequence_count=42)
         self.assertTrue(psc & 0xc000 == 0xc000)
+        header = get_sp_space_packet_header(
+            packet_id_byte_one=0x18, packet_id_byte_two=0xef, packet_sequence_control=psc,
+            data_length=0x1234
+        )
+        self.assertTrue(header == bytearray([0x18, 0xef, 0xc0, 42, 0x12, 0x34]))
 
     def test_generic_pus_c(self):
         pus_17_telecommand = Service17TmPacked(subservice=1, ssc=36)
@@ -45,6 +55,125 @@ class TestTelemetry(TestCase):
         self.assertTrue(raw_tm_created == pus_17_raw)
         self.assertTrue(pus_17_telemetry.get_tc_packet_id() == 0x8 << 8 | 0xef)
 
+    def test_service_1_failure_reports(self):
+        tc_info = bytearray([0x18, 0xef, 0xc0, 0x01])
+        step_failure = PusTelemetryCreator(
+            service=1, subservice=6,
+            source_data=tc_info + bytearray([0x02, 0x12, 0x34, 0, 0, 0, 0x05, 0xff, 0xff, 0xff, 0xff])
+        )
+        service_1_tm = Service1TM(step_failure.pack())
+        self.assertTrue(service_1_tm.get_step_number() == 2)
+        self.assertTrue(service_1_tm.get_error_code() == 0x1234)
+        self.assertTrue(service_1_tm.error_param1 == 5)
+        self.assertTrue(service_1_tm.error_param2 == 0xffffffff)
+
+        completion_failure = PusTelemetryCreator(
+            service=1, subservice=8,
+            source_data=tc_info + bytearray([0x12, 0x34, 0, 0, 0, 0x05, 0, 0, 0, 0x06])
+        )
+        service_1_tm = Service1TM(completion_failure.pack())
+        self.assertTrue(service_1_tm.get_error_code() == 0x1234)
+        self.assertTrue(service_1_tm.error_param1 == 5)
+        self.assertTrue(service_1_tm.error_param2 == 6)
+
+    def test_service_1_subservice_dispatch(self):
+        class CustomService1TM(Service1TM):
+            def _handle_step_success(self):
+                super()._handle_step_success()
+                self.step_number += 100
+
+        tc_info = bytearray([0x18, 0xef, 0xc0, 0x01])
+        step_success = PusTelemetryCreator(
+            service=1, subservice=5, source_data=tc_info + bytearray([0x02])
+        )
+        service_1_tm = CustomService1TM(step_success.pack())
+        self.assertTrue(service_1_tm.get_step_number() == 102)
+        self.assertTrue(service_1_tm.print_info == "Success Verification : Step Success")
+
+        # Unknown subservices still get the failure or success information
+        invalid_failure = PusTelemetryCreator(service=1, subservice=10, source_data=tc_info)
+        service_1_tm = Service1TM(invalid_failure.pack())
+        self.assertTrue(service_1_tm.has_tc_error_code)
+        self.assertTrue(service_1_tm.print_info == "Failure Verficiation")
+        invalid_success = PusTelemetryCreator(service=1, subservice=9, source_data=tc_info)
+        service_1_tm = Service1TM(invalid_success.pack())
+        self.assertFalse(service_1_tm.has_tc_error_code)
+        self.assertTrue(service_1_tm.print_info == "Success Verification")
+
+    def test_tm_creator_set_source_data(self):
+        pus_17_telemetry = Service17TmPacked(subservice=2, ssc=12)
+        pus_17_telemetry.set_source_data(bytearray([1, 2, 3]))
+        pus_17_raw = pus_17_telemetry.pack()
+        tm = PusTelemetry(pus_17_raw)
+        self.assertTrue(tm.get_packet_size() == len(pus_17_raw))
+        self.assertTrue(tm.get_tm_data() == bytearray([1, 2, 3]))
+        self.assertTrue(tm.get_ssc() == 12)
+        self.assertTrue(tm.is_valid())
+        self.assertRaises(TypeError, pus_17_telemetry.set_source_data, [1, 2, 3])
+
+    def test_tm_creator_pack_into(self):
+        pus_17_telemetry = Service17TmPacked(subservice=2, ssc=12)
+        pus_17_telemetry.set_source_data(bytearray([1, 2, 3]))
+        packet_size = pus_17_telemetry.get_packet_size()
+        self.assertTrue(packet_size == len(pus_17_telemetry.pack()))
+        # Packet written at an offset inside a larger frame
+        frame = bytearray(packet_size + 4)
+        self.assertTrue(pus_17_telemetry.pack_into(frame, 2) == packet_size)
+        self.assertTrue(frame[0:2] == bytearray(2) and frame[-2:] == bytearray(2))
+        tm = PusTelemetry(frame[2:-2])
+        self.assertTrue(tm.is_valid())
+        self.assertTrue(tm.get_tm_data() == bytearray([1, 2, 3]))
+        # Buffer which fits the packet exactly
+        exact_buf = bytearray(packet_size)
+        self.assertTrue(pus_17_telemetry.pack_into(exact_buf) == packet_size)
+        self.assertTrue(PusTelemetry(exact_buf).is_valid())
+        # Buffer too small for the packet at the given offset, and negative offset
+        self.assertRaises(ValueError, pus_17_telemetry.pack_into, frame, 5)
+        self.assertRaises(ValueError, pus_17_telemetry.pack_into, bytearray(packet_size - 1))
+        self.assertRaises(ValueError, pus_17_telemetry.pack_into, frame, -1)
+
+    def test_tm_creator_memoryview_source_data(self):
+        pus_17_telemetry = Service17TmPacked(subservice=2, ssc=12)
+        source_data = bytearray([0, 1, 2, 3, 4])
+        pus_17_telemetry.set_source_data(memoryview(source_data)[1:4])
+        tm = PusTelemetry(pus_17_telemetry.pack())
+        self.assertTrue(tm.get_tm_data() == bytearray([1, 2, 3]))
+        self.assertTrue(tm.is_valid())
+        pus_17_telemetry.set_source_data(bytes([4, 5]))
+        tm = PusTelemetry(pus_17_telemetry.pack())
+        self.assertTrue(tm.get_tm_data() == bytearray([4, 5]))
+        self.assertTrue(tm.is_valid())
+
+    def test_service_20_parameter_reply(self):
+        for ptc, pfc, param_format, param in ((3, 14, '!I', 7), (4, 14, '!i', -7), (5, 1, '!f', 1.5)):
+            source_data = bytearray([0, 0, 0, 1, 2, 3, 0, 4, ptc, pfc, 1, 1])
+            source_data.extend(struct.pack(param_format, param))
+            service_20_tm = Service20TM(
+                PusTelemetryCreator(service=20, subservice=130, source_data=source_data).pack()
+            )
+            self.assertTrue(service_20_tm.objectId == 1)
+            self.assertTrue(service_20_tm.parameter_id == 0x02030004)
+            self.assertTrue(service_20_tm.domain_id == 2)
+            self.assertTrue(service_20_tm.unique_id == 3)
+            self.assertTrue(service_20_tm.linear_index == 4)
+            self.assertTrue(service_20_tm.type_ptc == ptc)
+            self.assertTrue(service_20_tm.type_pfc == pfc)
+            self.assertTrue(service_20_tm.param == param)
+        # Truncated reply without the parameter type field
+        service_20_tm = Service20TM(PusTelemetryCreator(
+            service=20, subservice=130, source_data=bytearray([0, 0, 0, 1, 2, 3, 0, 4, 3])
+        ).pack())
+        self.assertTrue(service_20_tm.linear_index == 4)
+        self.assertTrue(service_20_tm.type_ptc == 0)
+        self.assertTrue(service_20_tm.print_info == "Parameter Service Reply")
+        # Supported parameter type, but the value is cut short
+        with self.assertLogs(service_20_logger, level="WARNING"):
+            service_20_tm = Service20TM(PusTelemetryCreator(
+                service=20, subservice=130,
+                source_data=bytearray([0, 0, 0, 1, 2, 3, 0, 4, 3, 14, 1, 1, 0, 0])
+            ).pack())
+        self.assertTrue(service_20_tm.param == 0)
+
     def test_list_functionality(self):
         pus_17_telecommand = Service17TmPacked(subservice=1, ssc=36)
         pus_17_raw = pus_17_telecommand.pack()
@@ -114,6 +243,31 @@ class TestTelecommand(TestCase):
         self.assertTrue(pus_17_telecommand.get_service() == 17)
         self.assertTrue(pus_17_telecommand.get_subservice() == 1)
 
+    def test_data_field_header(self):
+        data_field_header = PusTcDataFieldHeaderSerialize(service_type=17, service_subtype=1)
+        header_raw = data_field_header.pack()
+        self.assertTrue(header_raw == bytearray([0x1f, 17, 1, 0]))
+        # Modifying a packed header must not affect later packing
+        header_raw[1] = 42
+        self.assertTrue(data_field_header.pack() == bytearray([0x1f, 17, 1, 0]))
+        # Setting a field updates the serialized header
+        data_field_header.service_type = 42
+        data_field_header.source_id = 3
+        self.assertTrue(data_field_header.pack() == bytearray([0x1f, 42, 1, 3]))
+        data_field_header.pus_version_and_ack_byte = 0x2a
+        self.assertTrue(data_field_header.pus_tc_version == 2)
+        self.assertTrue(data_field_header.ack_flags == 0xa)
+        self.assertTrue(data_field_header.pack() == bytearray([0x2a, 42, 1, 3]))
+
+    def test_service_20_float_vector(self):
+        tc = pack_float_vector_parameter_command(
+            object_id=bytearray([1, 2, 3, 4]), domain_id=1, unique_id=2, parameter=[1.0, -2.5],
+            ssc=0, apid=42
+        )
+        self.assertTrue(tc.get_app_data() == bytearray(
+            [1, 2, 3, 4, 1, 2, 0, 0, 5, 1, 1, 2, 0x3f, 0x80, 0, 0, 0xc0, 0x20, 0, 0]
+        ))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,11 @@
 import enum
+import struct
 from typing import Tuple
 
 
 SPACE_PACKET_HEADER_SIZE = 6
+# Packet ID bytes, packet sequence control and data length, big endian
+SPACE_PACKET_HEADER_STRUCT = struct.Struct("!BBHH")
 
 
 class PacketTypes(enum.IntEnum):
@@ -11,6 +14,11 @@ class PacketTypes(enum.IntEnum):
 
 
 class SpacePacketCommonFields:
+    __slots__ = (
+        "packet_type", "apid", "ssc", "secondary_header_flag", "sequence_flags", "psc", "version",
+        "data_length", "packet_id"
+    )
+
     def __init__(
             self, packet_type: PacketTypes, apid: int, source_sequence_count: int, data_length: int,
             version: int = 0b000, secondary_header_flag: int = 0b1, sequence_flags: int = 0b11
@@ -37,6 +45,8 @@ class SpacePacketHeaderDeserializer(SpacePacketCommonFields):
     This class unnpacks the common spacepacket header, also see PUS structure below or
     PUS documentation.
     """
+    __slots__ = ()
+
     def __init__(self, pus_packet_raw: bytearray):
         """
         Deserializes space packet fields from raw bytearray
@@ -71,6 +81,8 @@ class SpacePacketHeaderDeserializer(SpacePacketCommonFields):
 
 
 class SpacePacketHeaderSerializer(SpacePacketCommonFields):
+    __slots__ = ("packet_id_bytes", "header")
+
     def __init__(
             self, apid: int, packet_type: PacketTypes, data_length: int, source_sequence_count: int,
             secondary_header_flag: int = 0b1, version: int = 0b000, sequence_flags: int = 0b11
@@ -144,11 +156,7 @@ def get_sp_space_packet_header(
         packet_id_byte_one: int, packet_id_byte_two: int, packet_sequence_control: int,
         data_length: int
 ) -> bytearray:
-    header = bytearray()
-    header.append(packet_id_byte_one)
-    header.append(packet_id_byte_two)
-    header.append((packet_sequence_control & 0xFF00) >> 8)
-    header.append(packet_sequence_control & 0xFF)
-    header.append((data_length & 0xFF00) >> 8)
-    header.append(data_length & 0xFF)
-    return header
+    return bytearray(SPACE_PACKET_HEADER_STRUCT.pack(
+        packet_id_byte_one, packet_id_byte_two, packet_sequence_control & 0xFFFF,
+        data_length & 0xFFFF
+    ))
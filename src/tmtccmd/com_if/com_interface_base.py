@@ -9,13 +9,15 @@ Abstract methods must be implemented by child class (e.g. Ethernet Com IF)
 :author:     R. Mueller
 """
 from abc import abstractmethod
+from collections import deque
+from typing import Any
 
 from tmtccmd.ecss.tc import PusTelecommand
+from tmtccmd.ecss.tm import PusTelemetry
 from tmtccmd.pus_tm.factory import PusTmListT
 from tmtccmd.utility.tmtc_printer import TmTcPrinter
 
 
-# pylint: disable=useless-return
 # pylint: disable=no-self-use
 # pylint: disable=unused-argument
 class CommunicationInterface:
@@ -23,33 +25,54 @@ class CommunicationInterface:
     Generic form of a communication interface to separate communication logic from
     the underlying interface.
     """
-    def __init__(self, tmtc_printer: TmTcPrinter):
+    def __init__(self, tmtc_printer: TmTcPrinter, tm_queue_max_len: int = 4096):
+        """
+        :param tmtc_printer:
+        :param tm_queue_max_len: Maximum number of packets stored in the internal TM queue. If the
+        queue is full, the oldest packets are discarded.
+        """
         self.tmtc_printer = tmtc_printer
         self.valid = True
+        # Bounded queue which can be filled by a separate reception thread. Single element appends
+        # and pops on a deque are thread-safe, so no additional lock is required. It is only
+        # created once the first packet is pushed, so interfaces which do not use it do not
+        # allocate it.
+        self._tm_queue = None
+        self._tm_queue_max_len = tm_queue_max_len
+
+    def _push_tm(self, packet: PusTelemetry):
+        """
+        Store a received packet in the internal TM queue. Can be called by a reception thread
+        of the child class.
+        :param packet:
+        """
+        if self._tm_queue is None:
+            self._tm_queue = deque(maxlen=self._tm_queue_max_len)
+        self._tm_queue.append(packet)
 
     @abstractmethod
-    def initialize(self, args: any = None) -> any:
+    def initialize(self, args: Any = None) -> Any:
         """
         Perform initializations step which can not be done in constructor or which require
         returnvalues.
         """
 
     @abstractmethod
-    def open(self, args: any = None) -> None:
+    def open(self, args: Any = None) -> None:
         """
         Opens the communication interface to allow communication.
         @return:
         """
 
     @abstractmethod
-    def close(self, args: any = None) -> None:
+    def close(self, args: Any = None) -> None:
         """
         Closes the ComIF and releases any held resources (for example a Communication Port)
         :return:
         """
 
     @abstractmethod
-    def send_data(self, data: bytearray):
+    def send_data(self, data: bytearray) -> None:
         """
         Send raw data
         """
@@ -63,20 +86,24 @@ class CommunicationInterface:
         :return: None for now
         """
 
-    @abstractmethod
-    def receive_telemetry(self, parameters: any = 0) -> PusTmListT:
+    def receive_telemetry(self, parameters: Any = 0) -> PusTmListT:
         """
-        Returns a list of packets. The child class can use a separate thread to poll for
-        the packets or use some other mechanism and container like a deque to store packets
-        to be returned here.
+        Returns a list of packets. The default implementation returns all packets stored in
+        the internal TM queue with _push_tm. The child class can use a separate thread to poll
+        for the packets or override this function.
         :param parameters:
         :return:
         """
         packet_list = []
+        tm_queue = self._tm_queue
+        if tm_queue is None:
+            return packet_list
+        while tm_queue:
+            packet_list.append(tm_queue.popleft())
         return packet_list
 
     @abstractmethod
-    def data_available(self, parameters: any) -> int:
+    def data_available(self, parameters: Any) -> int:
         """
         Check whether TM data is available
         :param parameters: Can be an arbitrary parameter like a timeout
@@ -5,7 +5,7 @@
 
 @author R. Mueller
 """
-import select
+import selectors
 import socket
 from typing import Union
 
@@ -21,6 +21,9 @@ LOGGER = get_logger()
 
 UDP_RECV_WIRETAPPING_ENABLED = False
 UDP_SEND_WIRETAPPING_ENABLED = False
+# Maximum number of datagrams read in one receive call. Remaining datagrams are read on the
+# next poll, so a fast sender can not keep the receive call from returning.
+UDP_MAX_PACKETS_PER_POLL = 256
 
 
 # pylint: disable=abstract-method
@@ -34,7 +37,8 @@ class TcpIpUdpComIF(CommunicationInterface):
                  send_address: ethernet_address_t, max_recv_size: int,
                  recv_addr: Union[None, ethernet_address_t] = None,
                  tmtc_printer: Union[None, TmTcPrinter] = None,
-                 init_mode: int = CoreModeList.LISTENER_MODE):
+                 init_mode: int = CoreModeList.LISTENER_MODE,
+                 max_packets_per_poll: int = UDP_MAX_PACKETS_PER_POLL):
         """
         Initialize a communication interface to send and receive UDP datagrams.
         :param tm_timeout:
@@ -43,15 +47,18 @@ class TcpIpUdpComIF(CommunicationInterface):
         :param max_recv_size:
         :param recv_addr:
         :param tmtc_printer: Printer instance, can be passed optionally to allow packet debugging
+        :param max_packets_per_poll: Maximum number of datagrams read in one receive call
         """
         super().__init__(tmtc_printer)
         self.tm_timeout = tm_timeout
         self.tc_timeout_factor = tc_timeout_factor
         self.udp_socket = None
+        self.selector = None
         self.send_address = send_address
         self.recv_addr = recv_addr
         self.max_recv_size = max_recv_size
         self.init_mode = init_mode
+        self.max_packets_per_poll = max_packets_per_poll
 
     def __del__(self):
         try:
@@ -70,8 +77,11 @@ class TcpIpUdpComIF(CommunicationInterface):
         if self.recv_addr is not None:
             LOGGER.info(f"Binding UDP socket to {self.recv_addr[0]} and port {self.recv_addr[1]}")
             self.udp_socket.bind(self.recv_addr)
-        # Set non-blocking because we use select.
+        # Set non-blocking because we use a selector. The socket is registered once here so
+        # polling does not need to rebuild the descriptor sets on every call.
         self.udp_socket.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.udp_socket, selectors.EVENT_READ)
         if self.init_mode == CoreModeList.LISTENER_MODE:
             from tmtccmd.pus_tc.service_17_test import pack_service17_ping_command
             # Send ping command immediately so the reception address is known for UDP
@@ -79,6 +89,9 @@ class TcpIpUdpComIF(CommunicationInterface):
             self.send_telecommand(ping_cmd.pack(), ping_cmd)
 
     def close(self, args: any = None) -> None:
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
         if self.udp_socket is not None:
             self.udp_socket.close()
 
@@ -93,28 +106,32 @@ class TcpIpUdpComIF(CommunicationInterface):
             LOGGER.warning("Not all bytes were sent!")
 
     def data_available(self, timeout: float = 0) -> bool:
-        if self.udp_socket is None:
+        if self.selector is None:
             return False
-        ready = select.select([self.udp_socket], [], [], timeout)
-        if ready[0]:
+        if self.selector.select(timeout):
             return True
         return False
 
     def receive_telemetry(self, poll_timeout: float = 0) -> PusTmListT:
         if self.udp_socket is None:
             return []
+        packet_list = []
         try:
             ready = self.data_available(poll_timeout)
             if ready:
-                data, sender_addr = self.udp_socket.recvfrom(self.max_recv_size)
-                tm_packet = PusTelemetryFactory.create(bytearray(data))
-                if tm_packet is None:
-                    return []
-                packet_list = [tm_packet]
-                return packet_list
-            return []
+                # The socket is non-blocking, so datagrams which arrived in the meantime
+                # can be drained in one call instead of polling once per datagram
+                for _ in range(self.max_packets_per_poll):
+                    try:
+                        data, sender_addr = self.udp_socket.recvfrom(self.max_recv_size)
+                    except BlockingIOError:
+                        break
+                    tm_packet = PusTelemetryFactory.create(bytearray(data))
+                    if tm_packet is not None:
+                        packet_list.append(tm_packet)
+            return packet_list
         except ConnectionResetError:
             LOGGER.warning("Connection reset exception occured!")
-            return []
+            return packet_list
 
 
@@ -7,9 +7,9 @@
 @manual
 @author         R. Mueller, P. Scheurenbrand, D. Nguyen
 """
-import threading
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 
 from PyQt5.QtWidgets import *
@@ -28,6 +28,8 @@ import tmtccmd.defaults as defaults_module
 
 
 LOGGER = get_logger()
+# Communication interfaces in combo box order, resolved once at import time
+COM_IF_LIST = list(CoreComInterfaces)
 
 
 class TmTcFrontend(QMainWindow, FrontendBase):
@@ -52,6 +54,11 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         self.service_list = []
         self.debug_mode = True
         self.is_busy = False
+        self.send_buttons_enabled = True
+        # TMTC actions are run one at a time, so a single worker thread is reused for all of them
+        # instead of spawning a new thread on every button click.
+        self.tmtc_action_executor = ThreadPoolExecutor(max_workers=1)
+        self.tmtc_action_futures = []
         module_path = os.path.abspath(defaults_module.__file__).replace("__init__.py", "")
         self.logo_path = f"{module_path}/logo.png"
 
@@ -63,6 +70,23 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         self.start_ui()
         sys.exit(qt_app.exec_())
 
+    def closeEvent(self, event):
+        # Drop queued TMTC actions and release the worker thread without blocking the GUI
+        # thread on a running action
+        for future in self.tmtc_action_futures:
+            future.cancel()
+        self.tmtc_action_futures.clear()
+        self.tmtc_action_executor.shutdown(wait=False)
+        super().closeEvent(event)
+
+    def __submit_tmtc_action(self):
+        self.tmtc_action_futures = [
+            future for future in self.tmtc_action_futures if not future.done()
+        ]
+        self.tmtc_action_futures.append(
+            self.tmtc_action_executor.submit(self.handle_tm_tc_action)
+        )
+
     def set_gui_logo(self, logo_total_path: str):
         if os.path.isfile(logo_total_path):
             self.logo_path = logo_total_path
@@ -88,9 +112,8 @@ class TmTcFrontend(QMainWindow, FrontendBase):
             LOGGER.info("Start Service Test Button pressed.")
         # LOGGER.info("start testing service: " + str(tmtcc_config.G_SERVICE))
         # self.tmtc_handler.mode = tmtcc_config.ModeList.SEQUENTIAL_CMD_MODE
-        # start the action in a new process
-        p = threading.Thread(target=self.handle_tm_tc_action)
-        p.start()
+        # start the action in the worker thread
+        self.__submit_tmtc_action()
 
     def send_single_command_clicked(self, table):
         if self.debug_mode:
@@ -118,9 +141,8 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         self.tmtc_handler.single_command_package = command.pack_command_tuple()
 
         # self.tmtc_handler.mode = tmtcc_config.ModeList.SINGLE_CMD_MODE
-        # start the action in a new process
-        p = threading.Thread(target=self.handle_tm_tc_action)
-        p.start()
+        # start the action in the worker thread
+        self.__submit_tmtc_action()
 
     def handle_tm_tc_action(self):
         if self.debug_mode:
@@ -128,13 +150,22 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         self.tmtc_handler.mode = CoreModeList.SEQUENTIAL_CMD_MODE
 
         self.set_send_buttons(False)
-        self.tmtc_handler.perform_operation()
-        self.is_busy = False
-        self.set_send_buttons(True)
+        try:
+            self.tmtc_handler.perform_operation()
+        except Exception:
+            # The executor would otherwise store the exception in the discarded future
+            LOGGER.exception("TMTC action failed")
+        finally:
+            self.is_busy = False
+            self.set_send_buttons(True)
         if self.debug_mode:
             LOGGER.info("Finished TMTC action..")
 
     def set_send_buttons(self, state: bool):
+        # Skip the widget updates if the buttons are already in the requested state
+        if state == self.send_buttons_enabled:
+            return
+        self.send_buttons_enabled = state
         self.service_test_button.setEnabled(state)
         self.single_command_button.setEnabled(state)
 
@@ -245,9 +276,10 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         grid.addWidget(QLabel("Communication Interface:"), row, 0, 1, 1)
         com_if_combo_box = QComboBox()
         # add all possible ComIFs to the comboBox
-        for com_if in CoreComInterfaces:
+        for com_if in COM_IF_LIST:
             com_if_combo_box.addItem(str(com_if))
-        com_if_combo_box.setCurrentIndex(self.tmtc_handler.com_if)
+        if self.tmtc_handler.com_if in COM_IF_LIST:
+            com_if_combo_box.setCurrentIndex(COM_IF_LIST.index(self.tmtc_handler.com_if))
         com_if_combo_box.currentIndexChanged.connect(com_if_index_changed)
         grid.addWidget(com_if_combo_box, row, 1, 1, 1)
         row += 1
@@ -372,8 +404,9 @@ class SingleCommandTable(QTableWidget):
 
 
 def com_if_index_changed(index: int):
-    update_global(CoreGlobalIds.COM_IF, CoreComInterfaces(index))
-    LOGGER.info(f"Communication IF updated: {CoreComInterfaces(index)}")
+    com_if = COM_IF_LIST[index]
+    update_global(CoreGlobalIds.COM_IF, com_if)
+    LOGGER.info(f"Communication IF updated: {com_if}")
 
 
 def checkbox_print_hk_data(state: int):
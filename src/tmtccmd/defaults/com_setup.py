@@ -4,9 +4,12 @@ from typing import Union
 from tmtccmd.core.definitions import CoreGlobalIds, CoreComInterfaces
 from tmtccmd.core.globals_manager import get_global, update_global
 from tmtccmd.com_if.com_interface_base import CommunicationInterface
-from tmtccmd.com_if.serial_com_if import SerialConfigIds, SerialCommunicationType
+from tmtccmd.com_if.dummy_com_if import DummyComIF
+from tmtccmd.com_if.serial_com_if import SerialComIF, SerialConfigIds, SerialCommunicationType
 from tmtccmd.com_if.serial_utilities import determine_com_port, determine_baud_rate
-from tmtccmd.com_if.tcpip_utilities import TcpIpConfigIds
+from tmtccmd.com_if.tcpip_udp_com_if import TcpIpUdpComIF
+from tmtccmd.com_if.tcpip_utilities import TcpIpConfigIds, determine_udp_send_address, \
+    determine_recv_buffer_len, determine_udp_recv_address
 from tmtccmd.utility.tmtcc_logger import get_logger
 from tmtccmd.utility.tmtc_printer import TmTcPrinter
 
@@ -17,56 +20,18 @@ LOGGER = get_logger()
 def create_communication_interface_default(
         com_if: int, tmtc_printer: TmTcPrinter, json_cfg_path: str
 ) -> Union[CommunicationInterface, None]:
-    from tmtccmd.com_if.serial_com_if import SerialComIF
-    from tmtccmd.com_if.dummy_com_if import DummyComIF
-    from tmtccmd.com_if.tcpip_udp_com_if import TcpIpUdpComIF
-    from tmtccmd.com_if.qemu_com_if import QEMUComIF
     """
     Return the desired communication interface object
+    :param com_if: Communication interface ID
     :param tmtc_printer: TmTcPrinter object.
+    :param json_cfg_path: Path to the JSON configuration file
     :return: CommunicationInterface object
     """
     try:
-        if com_if == CoreComInterfaces.TCPIP_UDP:
-            ethernet_cfg_dict = get_global(CoreGlobalIds.ETHERNET_CONFIG)
-            send_addr = ethernet_cfg_dict[TcpIpConfigIds.SEND_ADDRESS]
-            recv_addr = ethernet_cfg_dict[TcpIpConfigIds.RECV_ADDRESS]
-            max_recv_size = ethernet_cfg_dict[TcpIpConfigIds.RECV_MAX_SIZE]
-            init_mode = get_global(CoreGlobalIds.MODE)
-            communication_interface = TcpIpUdpComIF(
-                tm_timeout=get_global(CoreGlobalIds.TM_TIMEOUT),
-                tc_timeout_factor=get_global(CoreGlobalIds.TC_SEND_TIMEOUT_FACTOR),
-                send_address=send_addr, recv_addr=recv_addr, max_recv_size=max_recv_size,
-                tmtc_printer=tmtc_printer, init_mode=init_mode
-            )
-        elif com_if == CoreComInterfaces.SERIAL_DLE or \
-                com_if == CoreComInterfaces.SERIAL_FIXED_FRAME:
-            serial_cfg = get_global(CoreGlobalIds.SERIAL_CONFIG)
-            serial_baudrate = serial_cfg[SerialConfigIds.SERIAL_BAUD_RATE]
-            serial_timeout = serial_cfg[SerialConfigIds.SERIAL_TIMEOUT]
-            # Determine COM port, either extract from JSON file or ask from user.
-            com_port = determine_com_port(json_cfg_path=json_cfg_path)
-            communication_interface = SerialComIF(
-                tmtc_printer=tmtc_printer, com_port=com_port, baud_rate=serial_baudrate,
-                serial_timeout=serial_timeout,
-                ser_com_type=SerialCommunicationType.DLE_ENCODING)
-            dle_max_queue_len = serial_cfg[SerialConfigIds.SERIAL_DLE_QUEUE_LEN]
-            dle_max_frame_size = serial_cfg[SerialConfigIds.SERIAL_DLE_MAX_FRAME_SIZE]
-            communication_interface.set_dle_settings(dle_max_queue_len, dle_max_frame_size,
-                                                     serial_timeout)
-        elif com_if == CoreComInterfaces.SERIAL_QEMU:
-            serial_cfg = get_global(CoreGlobalIds.SERIAL_CONFIG)
-            serial_timeout = serial_cfg[SerialConfigIds.SERIAL_TIMEOUT]
-            communication_interface = QEMUComIF(
-                tmtc_printer=tmtc_printer, serial_timeout=serial_timeout,
-                ser_com_type=SerialCommunicationType.DLE_ENCODING)
-            dle_max_queue_len = serial_cfg[SerialConfigIds.SERIAL_DLE_QUEUE_LEN]
-            dle_max_frame_size = serial_cfg[SerialConfigIds.SERIAL_DLE_MAX_FRAME_SIZE]
-            communication_interface.set_dle_settings(
-                dle_max_queue_len, dle_max_frame_size, serial_timeout
-            )
-        else:
-            communication_interface = DummyComIF(tmtc_printer=tmtc_printer)
+        com_if_factory = COM_IF_FACTORY_DICT.get(com_if, __create_dummy_com_if)
+        communication_interface = com_if_factory(
+            tmtc_printer=tmtc_printer, json_cfg_path=json_cfg_path
+        )
         if not communication_interface.valid:
             LOGGER.warning("Invalid communication interface!")
             sys.exit()
@@ -78,9 +43,77 @@ def create_communication_interface_default(
         sys.exit(1)
 
 
+def __create_tcpip_udp_com_if(
+        tmtc_printer: TmTcPrinter, json_cfg_path: str
+) -> CommunicationInterface:
+    ethernet_cfg_dict = get_global(CoreGlobalIds.ETHERNET_CONFIG)
+    send_addr = ethernet_cfg_dict[TcpIpConfigIds.SEND_ADDRESS]
+    recv_addr = ethernet_cfg_dict[TcpIpConfigIds.RECV_ADDRESS]
+    max_recv_size = ethernet_cfg_dict[TcpIpConfigIds.RECV_MAX_SIZE]
+    init_mode = get_global(CoreGlobalIds.MODE)
+    return TcpIpUdpComIF(
+        tm_timeout=get_global(CoreGlobalIds.TM_TIMEOUT),
+        tc_timeout_factor=get_global(CoreGlobalIds.TC_SEND_TIMEOUT_FACTOR),
+        send_address=send_addr, recv_addr=recv_addr, max_recv_size=max_recv_size,
+        tmtc_printer=tmtc_printer, init_mode=init_mode
+    )
+
+
+def __create_serial_com_if(
+        tmtc_printer: TmTcPrinter, json_cfg_path: str
+) -> CommunicationInterface:
+    serial_cfg = get_global(CoreGlobalIds.SERIAL_CONFIG)
+    serial_baudrate = serial_cfg[SerialConfigIds.SERIAL_BAUD_RATE]
+    serial_timeout = serial_cfg[SerialConfigIds.SERIAL_TIMEOUT]
+    # Determine COM port, either extract from JSON file or ask from user.
+    com_port = determine_com_port(json_cfg_path=json_cfg_path)
+    communication_interface = SerialComIF(
+        tmtc_printer=tmtc_printer, com_port=com_port, baud_rate=serial_baudrate,
+        serial_timeout=serial_timeout,
+        ser_com_type=SerialCommunicationType.DLE_ENCODING)
+    dle_max_queue_len = serial_cfg[SerialConfigIds.SERIAL_DLE_QUEUE_LEN]
+    dle_max_frame_size = serial_cfg[SerialConfigIds.SERIAL_DLE_MAX_FRAME_SIZE]
+    communication_interface.set_dle_settings(dle_max_queue_len, dle_max_frame_size,
+                                             serial_timeout)
+    return communication_interface
+
+
+def __create_serial_qemu_com_if(
+        tmtc_printer: TmTcPrinter, json_cfg_path: str
+) -> CommunicationInterface:
+    # Imported here so that asyncio is only loaded when the QEMU interface is actually used
+    from tmtccmd.com_if.qemu_com_if import QEMUComIF
+    serial_cfg = get_global(CoreGlobalIds.SERIAL_CONFIG)
+    serial_timeout = serial_cfg[SerialConfigIds.SERIAL_TIMEOUT]
+    communication_interface = QEMUComIF(
+        tmtc_printer=tmtc_printer, serial_timeout=serial_timeout,
+        ser_com_type=SerialCommunicationType.DLE_ENCODING)
+    dle_max_queue_len = serial_cfg[SerialConfigIds.SERIAL_DLE_QUEUE_LEN]
+    dle_max_frame_size = serial_cfg[SerialConfigIds.SERIAL_DLE_MAX_FRAME_SIZE]
+    communication_interface.set_dle_settings(
+        dle_max_queue_len, dle_max_frame_size, serial_timeout
+    )
+    return communication_interface
+
+
+def __create_dummy_com_if(
+        tmtc_printer: TmTcPrinter, json_cfg_path: str
+) -> CommunicationInterface:
+    return DummyComIF(tmtc_printer=tmtc_printer)
+
+
+# Maps the communication interface IDs to the functions creating the interface. Unknown IDs
+# fall back to the dummy interface.
+COM_IF_FACTORY_DICT = {
+    CoreComInterfaces.TCPIP_UDP: __create_tcpip_udp_com_if,
+    CoreComInterfaces.SERIAL_DLE: __create_serial_com_if,
+    CoreComInterfaces.SERIAL_FIXED_FRAME: __create_serial_com_if,
+    CoreComInterfaces.SERIAL_QEMU: __create_serial_qemu_com_if,
+    CoreComInterfaces.DUMMY: __create_dummy_com_if
+}
+
+
 def default_tcpip_udp_cfg_setup(json_cfg_path: str):
-    from tmtccmd.com_if.tcpip_utilities import determine_udp_send_address, \
-        determine_recv_buffer_len, determine_udp_recv_address
     update_global(CoreGlobalIds.USE_ETHERNET, True)
     # This will either load the addresses from a JSON file or prompt them from the user.
     send_tuple = determine_udp_send_address(json_cfg_path=json_cfg_path)
@@ -110,7 +143,7 @@ def set_up_serial_cfg(
     """
     Default configuration to set up serial communication. The serial port and the baud rate
     will be determined from a JSON configuration file and prompted from the user
-    :param json_cfg_path:
+    :param json_cfg_path: Path to the JSON configuration file
     :param com_if:
     :param com_port:
     :param baud_rate:
@@ -15,6 +15,10 @@ from tmtccmd.utility.tmtcc_logger import get_logger
 from tmtccmd.ecss.conf import set_default_apid, set_pus_tc_version, set_pus_tm_version, PusVersion
 
 LOGGER = get_logger()
+SERIAL_COM_IFS = frozenset((
+    CoreComInterfaces.SERIAL_DLE, CoreComInterfaces.SERIAL_FIXED_FRAME,
+    CoreComInterfaces.SERIAL_QEMU
+))
 
 
 def set_json_cfg_path(json_cfg_path: str):
@@ -132,13 +136,10 @@ def set_default_globals_post_args_parsing(
     # baud rate and serial port which need to be set once but are expected to stay
     # the same for a given machine. Therefore, we use a JSON file to store and extract
     # those values
-    if com_if_param == CoreComInterfaces.SERIAL_DLE or \
-            com_if_param == CoreComInterfaces.SERIAL_FIXED_FRAME or \
-            com_if_param == CoreComInterfaces.SERIAL_QEMU:
+    if com_if_param in SERIAL_COM_IFS:
         default_serial_cfg_setup(com_if=com_if_param, json_cfg_path=json_cfg_path)
-
     # Same as above, but for server address and server port
-    if com_if_param == CoreComInterfaces.TCPIP_UDP:
+    elif com_if_param == CoreComInterfaces.TCPIP_UDP:
         # TODO: Port and IP address can also be passed as CLI parameters.
         #      Use them here if applicable?
         default_tcpip_udp_cfg_setup(json_cfg_path=json_cfg_path)
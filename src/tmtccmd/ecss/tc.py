@@ -22,25 +22,94 @@ except ImportError:
     sys.exit(1)
 
 
+# CRC16-CCITT checksum function used for the PUS packet error control field. It is created once
+# because building the CRC function and its lookup table on every call is expensive.
+CRC16_CCITT_FUNC = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
+
+
 class PusTcDataFieldHeaderSerialize:
+    __slots__ = (
+        "_service_type", "_service_subtype", "_source_id", "_pus_tc_version", "_ack_flags",
+        "_header"
+    )
+
     def __init__(
             self, service_type: int, service_subtype: int, source_id: int = 0,
             pus_tc_version: int = 0b1, ack_flags: int = 0b1111
     ):
-        self.service_type = service_type
-        self.service_subtype = service_subtype
-        self.source_id = source_id
-        self.pus_tc_version = pus_tc_version
-        self.ack_flags = ack_flags
-        self.pus_version_and_ack_byte = pus_tc_version << 4 | ack_flags
+        self._service_type = service_type
+        self._service_subtype = service_subtype
+        self._source_id = source_id
+        self._pus_tc_version = pus_tc_version
+        self._ack_flags = ack_flags
+        self._header = b""
+        self.__serialize_header()
+
+    def __serialize_header(self):
+        # The header is only serialized when a field changes. It is cached as immutable bytes,
+        # so callers can not modify the cache through the result of pack().
+        self._header = bytes((
+            self.pus_version_and_ack_byte, self._service_type, self._service_subtype,
+            self._source_id
+        ))
+
+    @property
+    def service_type(self) -> int:
+        return self._service_type
+
+    @service_type.setter
+    def service_type(self, service_type: int):
+        self._service_type = service_type
+        self.__serialize_header()
+
+    @property
+    def service_subtype(self) -> int:
+        return self._service_subtype
+
+    @service_subtype.setter
+    def service_subtype(self, service_subtype: int):
+        self._service_subtype = service_subtype
+        self.__serialize_header()
+
+    @property
+    def source_id(self) -> int:
+        return self._source_id
+
+    @source_id.setter
+    def source_id(self, source_id: int):
+        self._source_id = source_id
+        self.__serialize_header()
+
+    @property
+    def pus_tc_version(self) -> int:
+        return self._pus_tc_version
+
+    @pus_tc_version.setter
+    def pus_tc_version(self, pus_tc_version: int):
+        self._pus_tc_version = pus_tc_version
+        self.__serialize_header()
+
+    @property
+    def ack_flags(self) -> int:
+        return self._ack_flags
+
+    @ack_flags.setter
+    def ack_flags(self, ack_flags: int):
+        self._ack_flags = ack_flags
+        self.__serialize_header()
+
+    @property
+    def pus_version_and_ack_byte(self) -> int:
+        return self._pus_tc_version << 4 | self._ack_flags
+
+    @pus_version_and_ack_byte.setter
+    def pus_version_and_ack_byte(self, pus_version_and_ack_byte: int):
+        self._pus_tc_version = pus_version_and_ack_byte >> 4
+        self._ack_flags = pus_version_and_ack_byte & 0x0f
+        self.__serialize_header()
 
     def pack(self) -> bytearray:
-        header_raw = bytearray()
-        header_raw.append(self.pus_version_and_ack_byte)
-        header_raw.append(self.service_type)
-        header_raw.append(self.service_subtype)
-        header_raw.append(self.source_id)
-        return header_raw
+        return bytearray(self._header)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -87,7 +156,7 @@ class PusTelecommand:
             print("Service value invalid. Setting to 0")
             service = 0
         # SSC can have maximum of 14 bits
-        if ssc > pow(2, 14):
+        if ssc > 0x3fff:
             print("SSC invalid, setting to 0")
             ssc = 0
         self._space_packet_header = SpacePacketHeaderSerializer(
@@ -127,15 +196,20 @@ class PusTelecommand:
         """
         Serializes the TC data fields into a bytearray.
         """
-        self.packed_data = bytearray()
-        self.packed_data.extend(self._space_packet_header.pack())
-        self.packed_data.extend(self._data_field_header.pack())
-        self.packed_data += self.app_data
-        crc_func = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
-        crc = crc_func(self.packed_data)
-
-        self.packed_data.append((crc & 0xFF00) >> 8)
-        self.packed_data.append(crc & 0xFF)
+        # The total size is known in advance, so the packet is built in place without regrowth
+        total_length = self.get_total_length()
+        self.packed_data = bytearray(total_length)
+        current_idx = SPACE_PACKET_HEADER_SIZE
+        self.packed_data[0:current_idx] = self._space_packet_header.pack()
+        # Copy the cached header bytes directly instead of allocating a bytearray through pack()
+        data_field_header = self._data_field_header._header  # pylint: disable=protected-access
+        self.packed_data[current_idx:current_idx + len(data_field_header)] = data_field_header
+        current_idx += len(data_field_header)
+        self.packed_data[current_idx:total_length - 2] = self.app_data
+        crc = CRC16_CCITT_FUNC(memoryview(self.packed_data)[0:total_length - 2])
+
+        self.packed_data[total_length - 2] = (crc & 0xFF00) >> 8
+        self.packed_data[total_length - 1] = crc & 0xFF
         return self.packed_data
 
     @staticmethod
@@ -183,14 +257,7 @@ class PusTelecommand:
         """
         Print the raw command in a clean format.
         """
-        packet = self.pack()
-        print("Command in Hexadecimal: [", end="")
-        for counter in range(len(packet)):
-            if counter == len(packet) - 1:
-                print(str(hex(packet[counter])), end="")
-            else:
-                print(str(hex(packet[counter])) + ", ", end="")
-        print("]")
+        print(f"Command in Hexadecimal: [{', '.join(hex(byte) for byte in self.pack())}]")
 
 
 def generate_packet_crc(tc_packet: bytearray) -> bytearray:
@@ -199,8 +266,7 @@ def generate_packet_crc(tc_packet: bytearray) -> bytearray:
     CRC16 checksum and adds it as correct Packet Error Control Code.
     Reference: ECSS-E70-41A p. 207-212
     """
-    crc_func = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
-    crc = crc_func(bytearray(tc_packet[0:len(tc_packet) - 2]))
+    crc = CRC16_CCITT_FUNC(memoryview(tc_packet)[0:len(tc_packet) - 2])
     tc_packet[len(tc_packet) - 2] = (crc & 0xFF00) >> 8
     tc_packet[len(tc_packet) - 1] = crc & 0xFF
     return tc_packet
@@ -212,8 +278,7 @@ def generate_crc(data: bytearray) -> bytearray:
     """
     data_with_crc = bytearray()
     data_with_crc += data
-    crc_func = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
-    crc = crc_func(data)
+    crc = CRC16_CCITT_FUNC(data)
     data_with_crc.append((crc & 0xFF00) >> 8)
     data_with_crc.append(crc & 0xFF)
     return data_with_crc
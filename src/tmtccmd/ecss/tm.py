@@ -1,11 +1,11 @@
 import math
 import time
 import datetime
-
-from crcmod import crcmod
+import struct
 
 from tmtccmd.ccsds.spacepacket import SpacePacketHeaderDeserializer, SPACE_PACKET_HEADER_SIZE
 from tmtccmd.ecss.conf import get_pus_tm_version, PusVersion
+from tmtccmd.ecss.tc import CRC16_CCITT_FUNC
 
 
 class PusTelemetry:
@@ -38,8 +38,9 @@ class PusTelemetry:
                 len(raw_telemetry):
             print("PusTelemetry: Passed packet shorter than specified packet length in PUS header")
             raise ValueError
+        # Use a memoryview to avoid copying the whole packet just to parse the header fields
         self._data_field_header = PusPacketDataFieldHeader(
-            raw_telemetry[SPACE_PACKET_HEADER_SIZE:], pus_version=self.pus_version
+            memoryview(raw_telemetry)[SPACE_PACKET_HEADER_SIZE:], pus_version=self.pus_version
         )
         if self._data_field_header.get_header_size() + SPACE_PACKET_HEADER_SIZE > \
                 len(raw_telemetry) - 2:
@@ -89,12 +90,10 @@ class PusTelemetry:
         return self._space_packet_header.packet_id
 
     def __perform_crc_check(self, raw_telemetry: bytearray):
-        crc_func = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
         if len(raw_telemetry) < self.get_packet_size():
             print("PusTelemetry: Invalid packet length")
             return
-        data_to_check = raw_telemetry[0:self.get_packet_size()]
-        crc = crc_func(data_to_check)
+        crc = CRC16_CCITT_FUNC(memoryview(raw_telemetry)[0:self.get_packet_size()])
         if crc == 0:
             self._valid = True
         else:
@@ -199,6 +198,10 @@ class PusPacketDataFieldHeader:
     """
     Unpacks the PUS packet data field header. Currently only supports CDS short timestamps
     """
+    __slots__ = (
+        "pus_version", "pus_version_number", "spacecraft_time_ref", "service_type",
+        "service_subtype", "subcounter", "destination_id", "time"
+    )
 
     def __init__(self, bytes_array: bytearray, pus_version: PusVersion):
         self.pus_version = pus_version
@@ -252,6 +255,10 @@ class PusPacketDataFieldHeader:
             return PusTelemetry.PUS_TIMESTAMP_SIZE + 7
 
 
+# P-field (1 byte), CCSDS days (2 bytes) and milliseconds of day (4 bytes), big endian
+CDS_SHORT_STRUCT = struct.Struct("!BHI")
+
+
 class PusCdsShortTimestamp:
     """
     Unpacks the time datafield of the TM packet. Right now, CDS Short timeformat is used,
@@ -282,28 +289,14 @@ class PusCdsShortTimestamp:
         """
         Returns a seven byte CDS short timestamp
         """
-        timestamp = bytearray()
         p_field = (PusCdsShortTimestamp.CDS_ID << 4) + 0
         days = \
             (datetime.datetime.utcnow() - PusCdsShortTimestamp.EPOCH).days + \
             PusCdsShortTimestamp.DAYS_CCSDS_TO_UNIX
-        days_h = (days & 0xFF00) >> 8
-        days_l = days & 0xFF
         seconds = time.time()
         fraction_ms = seconds - math.floor(seconds)
         days_ms = int((seconds % PusCdsShortTimestamp.SECONDS_PER_DAY) * 1000 + fraction_ms)
-        days_ms_hh = (days_ms & 0xFF000000) >> 24
-        days_ms_h = (days_ms & 0xFF0000) >> 16
-        days_ms_l = (days_ms & 0xFF00) >> 8
-        days_ms_ll = (days_ms & 0xFF)
-        timestamp.append(p_field)
-        timestamp.append(days_h)
-        timestamp.append(days_l)
-        timestamp.append(days_ms_hh)
-        timestamp.append(days_ms_h)
-        timestamp.append(days_ms_l)
-        timestamp.append(days_ms_ll)
-        return timestamp
+        return bytearray(CDS_SHORT_STRUCT.pack(p_field, days & 0xFFFF, days_ms & 0xFFFFFFFF))
 
     def print_time(self, content_list):
         content_list.append(self.time)
@@ -1,8 +1,18 @@
-from crcmod import crcmod
+import struct
+from typing import Union
 
 from tmtccmd.ecss.tm import PusCdsShortTimestamp, PusTelemetry
-from tmtccmd.ccsds.spacepacket import PacketTypes, SpacePacketHeaderSerializer
+from tmtccmd.ccsds.spacepacket import PacketTypes, SpacePacketHeaderSerializer, \
+    SPACE_PACKET_HEADER_SIZE
 from tmtccmd.ecss.conf import get_tm_apid, PusVersion, get_pus_tm_version
+from tmtccmd.ecss.tc import CRC16_CCITT_FUNC
+
+
+# Data field header without the timestamp: Version byte, service, subservice and subcounter.
+# PUS C uses a two byte subcounter and additionally contains a two byte destination ID.
+PUS_A_DATA_FIELD_HEADER_STRUCT = struct.Struct("!BBBB")
+PUS_C_DATA_FIELD_HEADER_STRUCT = struct.Struct("!BBBHH")
+CRC16_STRUCT = struct.Struct("!H")
 
 
 # pylint: disable=too-many-instance-attributes
@@ -18,7 +28,8 @@ class PusTelemetryCreator:
     the ESA PUS standard in the PusTelemetry documentation.
     """
     def __init__(self, service: int, subservice: int, ssc: int = 0,
-                 source_data: bytearray = bytearray([]), apid: int = -1, version: int = 0b000,
+                 source_data: Union[bytes, bytearray, memoryview] = bytearray([]),
+                 apid: int = -1, version: int = 0b000,
                  pus_version: PusVersion = PusVersion.UNKNOWN, pus_tm_version: int = 0b0001,
                  ack: int = 0b1111, secondary_header_flag: int = -1, space_time_ref: int = 0b0000,
                  destination_id: int = 0):
@@ -33,13 +44,11 @@ class PusTelemetryCreator:
         # packet type for telemetry is 0 as specified in standard
         # specified in standard
         packet_type = PacketTypes.PACKET_TYPE_TM
+        self._space_packet_header = None
         self.source_data = source_data
-        data_length = self.get_source_data_length(
-            timestamp_len=PusTelemetry.PUS_TIMESTAMP_SIZE, pus_version=pus_version
-        )
         self._space_packet_header = SpacePacketHeaderSerializer(
             apid=apid, packet_type=packet_type, secondary_header_flag=secondary_header_flag,
-            version=version, data_length=data_length, source_sequence_count=ssc
+            version=version, data_length=self._data_length, source_sequence_count=ssc
         )
         self.pus_version_and_ack_byte = pus_tm_version | space_time_ref
         # NOTE: In PUS-C, the PUS Version is 2 and specified for the first 4 bits.
@@ -54,46 +63,90 @@ class PusTelemetryCreator:
 
     def print(self):
         """ Print the raw command in a clean format. """
-        packet = self.pack()
-        print_out = "Telemetry in Hexadecimal: ["
-        for counter in range(len(packet)):
-            if counter == len(packet) - 1:
-                print_out += str(hex(packet[counter]))
-            else:
-                print_out += str(hex(packet[counter])) + ", "
-        print_out += "]"
-        print(print_out)
+        print(f"Telemetry in Hexadecimal: [{', '.join(hex(byte) for byte in self.pack())}]")
+
+    @property
+    def source_data(self) -> Union[bytes, bytearray, memoryview]:
+        return self._source_data
 
-    def set_source_data(self, source_data: bytearray):
+    @source_data.setter
+    def source_data(self, source_data: Union[bytes, bytearray, memoryview]):
+        # Source data is stored as passed and only copied once into the packet when packing
+        if isinstance(source_data, memoryview):
+            source_data = source_data.cast("B")
+        elif not isinstance(source_data, (bytes, bytearray)):
+            raise TypeError("PusTelemetryCreator: Invalid type of source data!")
+        self._source_data = source_data
+        self._data_length = self.get_source_data_length(
+            timestamp_len=PusTelemetry.PUS_TIMESTAMP_SIZE, pus_version=self.pus_version
+        )
+        # The space packet header is serialized once and cached. Its data length field depends on
+        # the source data length, so it needs to be rebuilt here.
+        sp_header = self._space_packet_header
+        if sp_header is not None:
+            self._space_packet_header = SpacePacketHeaderSerializer(
+                apid=sp_header.apid, packet_type=sp_header.packet_type,
+                secondary_header_flag=sp_header.secondary_header_flag, version=sp_header.version,
+                data_length=self._data_length, source_sequence_count=sp_header.ssc,
+                sequence_flags=sp_header.sequence_flags
+            )
+
+    def set_source_data(self, source_data: Union[bytes, bytearray, memoryview]):
         self.source_data = source_data
 
     def pack(self) -> bytearray:
         """
         Serializes the PUS telemetry into a raw packet.
         """
-        tm_packet_raw = bytearray()
+        tm_packet_raw = bytearray(self.get_packet_size())
+        self.pack_into(tm_packet_raw)
+        return tm_packet_raw
+
+    def pack_into(self, buf: Union[bytearray, memoryview], offset: int = 0) -> int:
+        """
+        Serializes the PUS telemetry directly into a caller provided buffer, for example
+        a transport frame, which avoids copying the packet from a temporary buffer.
+        :param buf: Writable buffer the packet is written into
+        :param offset: Start index of the packet inside the buffer
+        :return: Number of bytes written
+        :raises ValueError: The buffer is too small to hold the packet
+        """
+        packet_size = self.get_packet_size()
+        if offset < 0 or len(buf) - offset < packet_size:
+            raise ValueError("PusTelemetryCreator: Buffer too small to pack telemetry into!")
+        tm_packet_raw = memoryview(buf)[offset:offset + packet_size]
         # PUS Header
-        tm_packet_raw.extend(self._space_packet_header.pack())
-        # PUS Source Data Field
-        tm_packet_raw.append(self.data_field_version)
-        tm_packet_raw.append(self.service)
-        tm_packet_raw.append(self.subservice)
+        tm_packet_raw[0:SPACE_PACKET_HEADER_SIZE] = self._space_packet_header.pack()
+        # PUS Source Data Field. The PUS version is only checked once per packet.
         if self.pus_version == PusVersion.PUS_A:
-            tm_packet_raw.append(self.pack_subcounter)
+            PUS_A_DATA_FIELD_HEADER_STRUCT.pack_into(
+                tm_packet_raw, SPACE_PACKET_HEADER_SIZE, self.data_field_version, self.service,
+                self.subservice, self.pack_subcounter
+            )
+            timestamp_idx = SPACE_PACKET_HEADER_SIZE + \
+                PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_A
         else:
-            tm_packet_raw.append((self.pack_subcounter >> 8) & 0xff)
-            tm_packet_raw.append(self.pack_subcounter & 0xff)
-            tm_packet_raw.append((self.destination_id >> 8) & 0xff)
-            tm_packet_raw.append(self.destination_id & 0xff)
-        tm_packet_raw.extend(PusCdsShortTimestamp.pack_current_time())
+            PUS_C_DATA_FIELD_HEADER_STRUCT.pack_into(
+                tm_packet_raw, SPACE_PACKET_HEADER_SIZE, self.data_field_version, self.service,
+                self.subservice, self.pack_subcounter & 0xffff, self.destination_id & 0xffff
+            )
+            timestamp_idx = SPACE_PACKET_HEADER_SIZE + \
+                PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_C
+        source_data_idx = timestamp_idx + PusTelemetry.PUS_TIMESTAMP_SIZE
+        crc_idx = packet_size - 2
+        tm_packet_raw[timestamp_idx:source_data_idx] = PusCdsShortTimestamp.pack_current_time()
         # Source Data
-        tm_packet_raw.extend(self.source_data)
+        tm_packet_raw[source_data_idx:crc_idx] = self.source_data
         # CRC16 checksum
-        crc_func = crcmod.mkCrcFun(0x11021, rev=False, initCrc=0xFFFF, xorOut=0x0000)
-        crc16 = crc_func(tm_packet_raw)
-        tm_packet_raw.append((crc16 & 0xFF00) >> 8)
-        tm_packet_raw.append(crc16 & 0xFF)
-        return tm_packet_raw
+        crc16 = CRC16_CCITT_FUNC(tm_packet_raw[0:crc_idx])
+        CRC16_STRUCT.pack_into(tm_packet_raw, crc_idx, crc16)
+        return packet_size
+
+    def get_packet_size(self) -> int:
+        """
+        Retrieve the total size of the serialized TM packet in bytes.
+        """
+        return SPACE_PACKET_HEADER_SIZE + self._data_length + 1
 
     def get_source_data_length(self, timestamp_len: int, pus_version: PusVersion) -> int:
         """
@@ -103,14 +156,8 @@ class PusTelemetryCreator:
         the timestamp + the length of the application data + PUS timestamp size +
         length of the CRC16 checksum - 1
         """
-        try:
-            if pus_version == PusVersion.PUS_A:
-                data_length = PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_A + timestamp_len + \
-                              len(self.source_data) + 1
-            else:
-                data_length = PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_C + timestamp_len + \
-                              len(self.source_data) + 1
-            return data_length
-        except TypeError:
-            print("PusTelecommand: Invalid type of application data!")
-            return 0
+        if pus_version == PusVersion.PUS_A:
+            data_field_header_size = PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_A
+        else:
+            data_field_header_size = PusTelemetryCreator.DATA_FIELD_HEADER_SIZE_WITHOUT_TIME_PUS_C
+        return data_field_header_size + timestamp_len + len(self._source_data) + 1
@@ -1,12 +1,18 @@
 import enum
-from typing import Union
+import struct
+from typing import List, Union
 
 from tmtccmd.ecss.tc import PusTelecommand
-from tmtccmd.pus.service_20_parameter import EcssPtc, EcssPfcUnsigned
+from tmtccmd.pus.service_20_parameter import EcssPtc, EcssPfcUnsigned, EcssPfcReal
 from tmtccmd.utility.tmtcc_logger import get_logger
 from tmtccmd.config.globals import get_global_apid
 
 logger = get_logger()
+UINT8_MAX = 0xff
+# Domain ID, unique ID and linear index
+PARAMETER_ID_STRUCT = struct.Struct("!BBH")
+# PTC, PFC, rows and columns
+TYPE_AND_MATRIX_STRUCT = struct.Struct("!BBBB")
 
 
 def pack_boolean_parameter_command(
@@ -23,37 +29,56 @@ def pack_boolean_parameter_command(
     :param apid:
     @return:
     """
-    if apid == -1:
-        apid = get_global_apid()
-
-    parameter_id = bytearray(4)
-    parameter_id[0] = domain_id
-    if unique_id > 255:
-        logger.warning("Invalid unique ID, should be smaller than 255!")
-        return None
-    parameter_id[1] = unique_id
-    parameter_id[2] = 0
-    parameter_id[3] = 0
-    data_to_pack = bytearray(object_id)
-    data_to_pack.extend(parameter_id)
     # PTC and PFC for uint8_t according to CCSDS
-    ptc = EcssPtc.UNSIGNED
-    pfc = EcssPfcUnsigned.ONE_BYTE
-    rows = 1
-    columns = 1
-    data_to_pack.append(ptc)
-    data_to_pack.append(pfc)
-    data_to_pack.append(rows)
-    data_to_pack.append(columns)
-    data_to_pack.append(parameter)
-    return PusTelecommand(service=20, subservice=128, ssc=ssc, app_data=data_to_pack, apid=apid)
+    return __pack_parameter_command(
+        object_id=object_id, domain_id=domain_id, unique_id=unique_id, ptc=EcssPtc.UNSIGNED,
+        pfc=EcssPfcUnsigned.ONE_BYTE, rows=1, columns=1, parameter_raw=bytearray([parameter]),
+        ssc=ssc, apid=apid
+    )
 
 
 def pack_float_vector_parameter_command(
-        object_id: bytearray, domain_id: int, unique_id: int, parameter: bytearray, ssc: int,
+        object_id: bytearray, domain_id: int, unique_id: int, parameter: List[float], ssc: int,
         apid: int = -1
-):
-    pass
+) -> Union[PusTelecommand, None]:
+    """
+    Generic function to pack a telecommand to tweak a float vector parameter
+    :param object_id:
+    :param domain_id:
+    :param unique_id:
+    :param parameter:   Float vector entries
+    :param ssc:
+    :param apid:
+    @return:
+    """
+    # All vector entries are packed in one go instead of packing each float separately
+    return __pack_parameter_command(
+        object_id=object_id, domain_id=domain_id, unique_id=unique_id, ptc=EcssPtc.REAL,
+        pfc=EcssPfcReal.FLOAT_SIMPLE_PRECISION_IEEE, rows=1, columns=len(parameter),
+        parameter_raw=struct.pack(f"!{len(parameter)}f", *parameter), ssc=ssc, apid=apid
+    )
+
+
+def __pack_parameter_command(
+        object_id: bytearray, domain_id: int, unique_id: int, ptc: int, pfc: int, rows: int,
+        columns: int, parameter_raw: bytes, ssc: int, apid: int
+) -> Union[PusTelecommand, None]:
+    """
+    Common implementation of the parameter load command packers. Only the type information
+    and the raw parameter value differ between the parameter types.
+    """
+    if apid == -1:
+        apid = get_global_apid()
+    if unique_id > UINT8_MAX:
+        logger.warning("Invalid unique ID, should be smaller than 255!")
+        return None
+    data_to_pack = bytearray().join((
+        object_id,
+        pack_parameter_id(domain_id=domain_id, unique_id=unique_id, linear_index=0),
+        pack_type_and_matrix_data(ptc=ptc, pfc=pfc, rows=rows, columns=columns),
+        parameter_raw
+    ))
+    return PusTelecommand(service=20, subservice=128, ssc=ssc, app_data=data_to_pack, apid=apid)
 
 
 def pack_type_and_matrix_data(ptc: int, pfc: int, rows: int, columns: int) -> bytearray:
@@ -68,11 +93,11 @@ def pack_type_and_matrix_data(ptc: int, pfc: int, rows: int, columns: int) -> by
     :param columns:  Number of columns in parameter (for matrix or vector entries, 1 for scalar entries)
     :return: Parameter information field as 4 byte bytearray
     """
-    data = bytearray(4)
-    data[0] = ptc
-    data[1] = pfc
-    data[2] = rows
-    data[3] = columns
+    data = bytearray(TYPE_AND_MATRIX_STRUCT.size)
+    try:
+        TYPE_AND_MATRIX_STRUCT.pack_into(data, 0, ptc, pfc, rows, columns)
+    except struct.error as e:
+        raise ValueError(e) from e
     return data
 
 
@@ -85,9 +110,9 @@ def pack_parameter_id(domain_id: int, unique_id: int, linear_index: int) -> byte
     :param unique_id:       One byte unique ID
     :param linear_index:    Two byte linear index.
     """
-    parameter_id = bytearray(4)
-    parameter_id[0] = domain_id
-    parameter_id[1] = unique_id
-    parameter_id[2] = linear_index >> 8 & 0xff
-    parameter_id[3] = linear_index & 0xff
+    parameter_id = bytearray(PARAMETER_ID_STRUCT.size)
+    try:
+        PARAMETER_ID_STRUCT.pack_into(parameter_id, 0, domain_id, unique_id, linear_index & 0xffff)
+    except struct.error as e:
+        raise ValueError(e) from e
     return parameter_id
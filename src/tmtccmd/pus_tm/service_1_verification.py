@@ -13,6 +13,10 @@ from tmtccmd.ecss.tm_creator import PusTelemetryCreator
 from tmtccmd.utility.tmtcc_logger import get_logger
 
 LOGGER = get_logger()
+# Step number, error code and two error parameters of a step failure report
+STEP_FAILURE_STRUCT = struct.Struct('>BHII')
+# Error code and two error parameters of a failure report
+FAILURE_STRUCT = struct.Struct('>HII')
 
 
 class Service1TM(PusTelemetry):
@@ -34,10 +38,21 @@ class Service1TM(PusTelemetry):
             LOGGER.warning("Service1TM: TM data less than 4 bytes!")
         self.tc_packet_id = self._tm_data[0] << 8 | self._tm_data[1]
         self.tc_ssc = ((self._tm_data[2] & 0x3F) << 8) | self._tm_data[3]
-        if self.get_subservice() % 2 == 0:
-            self.__handle_failure_verification()
+        subservice = self.get_subservice()
+        if subservice % 2 == 0:
+            self.specify_packet_info("Failure Verficiation")
+            self.has_tc_error_code = True
         else:
-            self.__handle_success_verification()
+            self.specify_packet_info("Success Verification")
+        subservice_entry = self.SUBSERVICE_DICT.get(subservice)
+        if subservice_entry is None:
+            LOGGER.error("Service1TM: Invalid subservice")
+            return
+        packet_info, handler_name = subservice_entry
+        self.append_packet_info(packet_info)
+        if handler_name is not None:
+            # Handlers are looked up by name so subclasses can override them
+            getattr(self, handler_name)()
 
     def append_telemetry_content(self, content_list: list):
         super().append_telemetry_content(content_list=content_list)
@@ -65,41 +80,31 @@ class Service1TM(PusTelemetry):
         elif self.is_step_reply:
             header_list.append("Step Number")
 
-    def __handle_failure_verification(self):
-        self.specify_packet_info("Failure Verficiation")
-        self.has_tc_error_code = True
-        if self.get_subservice() == 2:
-            self.append_packet_info(" : Acceptance failure")
-        elif self.get_subservice() == 4:
-            self.append_packet_info(" : Start failure")
-        elif self.get_subservice() == 6:
-            self.is_step_reply = True
-            self.append_packet_info(" : Step Failure")
-            self.step_number = struct.unpack('>B', self._tm_data[4:5])[0]
-            self.err_code = struct.unpack('>H', self._tm_data[5:7])[0]
-            self.error_param1 = struct.unpack('>I', self._tm_data[7:11])[0]
-            self.error_param2 = struct.unpack('>I', self._tm_data[11:15])[0]
-        elif self.get_subservice() == 8:
-            self.err_code = struct.unpack('>H', self._tm_data[4:6])[0]
-            self.error_param1 = struct.unpack('>I', self._tm_data[6:10])[0]
-            self.error_param2 = struct.unpack('>I', self._tm_data[10:14])[0]
-        else:
-            LOGGER.error("Service1TM: Invalid subservice")
-
-    def __handle_success_verification(self):
-        self.specify_packet_info("Success Verification")
-        if self.get_subservice() == 1:
-            self.append_packet_info(" : Acceptance success")
-        elif self.get_subservice() == 3:
-            self.append_packet_info(" : Start success")
-        elif self.get_subservice() == 5:
-            self.is_step_reply = True
-            self.append_packet_info(" : Step Success")
-            self.step_number = struct.unpack('>B', self._tm_data[4:5])[0]
-        elif self.get_subservice() == 7:
-            self.append_packet_info(" : Completion success")
-        else:
-            LOGGER.error("Service1TM: Invalid subservice")
+    def _handle_step_failure(self):
+        self.is_step_reply = True
+        self.step_number, self.err_code, self.error_param1, self.error_param2 = \
+            STEP_FAILURE_STRUCT.unpack_from(self._tm_data, 4)
+
+    def _handle_completion_failure(self):
+        self.err_code, self.error_param1, self.error_param2 = \
+            FAILURE_STRUCT.unpack_from(self._tm_data, 4)
+
+    def _handle_step_success(self):
+        self.is_step_reply = True
+        self.step_number = self._tm_data[4]
+
+    # Maps each subservice to the packet information suffix and the name of the method handling
+    # the subservice specific fields, if there are any.
+    SUBSERVICE_DICT = {
+        1: (" : Acceptance success", None),
+        2: (" : Acceptance failure", None),
+        3: (" : Start success", None),
+        4: (" : Start failure", None),
+        5: (" : Step Success", "_handle_step_success"),
+        6: (" : Step Failure", "_handle_step_failure"),
+        7: (" : Completion success", None),
+        8: (" : Completion failure", "_handle_completion_failure"),
+    }
 
     def get_tc_ssc(self):
         return self.tc_ssc
@@ -2,9 +2,23 @@ import os
 import struct
 
 from tmtccmd.ecss.tm import PusTelemetry
+from tmtccmd.pus.service_20_parameter import EcssPtc, EcssPfcUnsigned, EcssPfcSigned, EcssPfcReal
 from tmtccmd.utility.tmtcc_logger import get_logger
 
 logger = get_logger()
+# Object ID and parameter ID
+PARAM_HEADER_STRUCT = struct.Struct('!II')
+# PTC, PFC, columns and rows
+PARAM_TYPE_STRUCT = struct.Struct('!BBBB')
+UINT32_STRUCT = struct.Struct('!I')
+INT32_STRUCT = struct.Struct('!i')
+FLOAT_STRUCT = struct.Struct('!f')
+# Maps the supported (PTC, PFC) parameter types to the struct used to unpack the parameter value
+PARAM_TYPE_STRUCT_DICT = {
+    (EcssPtc.UNSIGNED, EcssPfcUnsigned.FOUR_BYTES): UINT32_STRUCT,
+    (EcssPtc.SIGNED, EcssPfcSigned.FOUR_BYTES): INT32_STRUCT,
+    (EcssPtc.REAL, EcssPfcReal.FLOAT_SIMPLE_PRECISION_IEEE): FLOAT_STRUCT
+}
 
 
 class Service20TM(PusTelemetry):
@@ -16,6 +30,12 @@ class Service20TM(PusTelemetry):
         self.domain_id = 0
         self.unique_id = 0
         self.linear_index = 0
+        self.type = 0
+        self.type_ptc = 0
+        self.type_pfc = 0
+        self.column = 0
+        self.row = 0
+        self.param = 0
 
         if data_size < 4:
             logger.warning("Service20TM: Invalid data length, less than 4")
@@ -24,28 +44,31 @@ class Service20TM(PusTelemetry):
             logger.warning("Service20TM: Invalid data length, less than 8 (Object ID and Parameter ID)")
             return
         else:
-            self.objectId = struct.unpack('!I', self._tm_data[0:4])[0]
-            self.parameter_id = struct.unpack('!I', self._tm_data[4:8])[0]
-            self.domain_id = self._tm_data[4]
-            self.unique_id = self._tm_data[5]
-            self.linear_index = self._tm_data[6] << 8 | self._tm_data[7]
+            self.objectId, self.parameter_id = PARAM_HEADER_STRUCT.unpack_from(self._tm_data, 0)
+            # The parameter ID consists of the one byte domain ID, the one byte unique ID and the
+            # two byte linear index
+            self.domain_id = self.parameter_id >> 24
+            self.unique_id = self.parameter_id >> 16 & 0xff
+            self.linear_index = self.parameter_id & 0xffff
 
-        self.param = 0
         if self.get_subservice() == 130:
-            # TODO: This needs to be more generic. Furthermore, we need to be able to handle vector and matrix
-            #       dumps as well and this is not possible in the current form.
-            self.type = struct.unpack('!H', self._tm_data[8:10])[0]
-            self.type_ptc = self._tm_data[8]
-            self.type_pfc = self._tm_data[9]
-            self.column = self._tm_data[10]
-            self.row = self._tm_data[11]
-            if len(self._tm_data) > 12:
-                if self.type_ptc == 3 and self.type_pfc == 14:
-                    self.param = struct.unpack('!I', self._tm_data[12:16])[0]
-                if self.type_ptc == 4 and self.type_pfc == 14:
-                    self.param = struct.unpack('!i', self._tm_data[12:16])[0]
-                if self.type_ptc == 5 and self.type_pfc == 1:
-                    self.param = struct.unpack('!f', self._tm_data[12:16])[0]
+            if data_size < 12:
+                logger.warning("Service20TM: Invalid data length, less than 12 (Parameter type)")
+            else:
+                # TODO: This needs to be more generic. Furthermore, we need to be able to handle vector and
+                #       matrix dumps as well and this is not possible in the current form.
+                self.type_ptc, self.type_pfc, self.column, self.row = \
+                    PARAM_TYPE_STRUCT.unpack_from(self._tm_data, 8)
+                self.type = self.type_ptc << 8 | self.type_pfc
+                param_struct = PARAM_TYPE_STRUCT_DICT.get((self.type_ptc, self.type_pfc))
+                if param_struct is not None:
+                    if data_size >= 12 + param_struct.size:
+                        self.param = param_struct.unpack_from(self._tm_data, 12)[0]
+                    else:
+                        logger.warning(
+                            f"Service20TM: Invalid data length, less than {12 + param_struct.size} "
+                            f"(Parameter value)"
+                        )
         else:
             logger.info(
                 "Error when receiving Pus Service 20 TM: subservice is not 130"